@@ -1,6 +1,9 @@
 import logging
+import logging.handlers
 import os
+import queue
 import requests
+import signal
 import sys
 import time
 from http import HTTPStatus
@@ -15,8 +18,11 @@ load_dotenv()
 PRACTICUM_TOKEN = os.getenv('PRACTICUM_TOKEN')
 TELEGRAM_TOKEN = os.getenv('TELEGRAM_TOKEN')
 TELEGRAM_CHAT_ID = os.getenv('TELEGRAM_CHAT_ID')
+TOKEN_NAMES = ('PRACTICUM_TOKEN', 'TELEGRAM_TOKEN', 'TELEGRAM_CHAT_ID')
 
 RETRY_PERIOD = 600
+MAX_RETRY_PERIOD = 3600
+REQUEST_TIMEOUT = (5, 30)
 ENDPOINT = 'https://practicum.yandex.ru/api/user_api/homework_statuses/'
 HEADERS = {'Authorization': f'OAuth {PRACTICUM_TOKEN}'}
 
@@ -26,12 +32,18 @@ HOMEWORK_VERDICTS = {
     'reviewing': 'Работа взята на проверку ревьюером.',
     'rejected': 'Работа проверена: у ревьюера есть замечания.'
 }
+HOMEWORK_MESSAGES = {
+    status: f'Изменился статус проверки работы "%s". {verdict}'
+    for status, verdict in HOMEWORK_VERDICTS.items()
+}
 
 
 def check_tokens():
     """Проверка наличия переменных окружения."""
-    SOURCE = ("PRACTICUM_TOKEN", "TELEGRAM_TOKEN", "TELEGRAM_CHAT_ID")
-    missing_variables = [token for token in SOURCE if not globals()[token]]
+    module_vars = globals()
+    missing_variables = [
+        token for token in TOKEN_NAMES if not module_vars[token]
+    ]
 
     if missing_variables:
         miss_tokens = ', '.join(missing_variables)
@@ -50,18 +62,20 @@ def send_message(bot, message):
         bot.send_message(TELEGRAM_CHAT_ID, message)
         logging.debug('Сообщение успешно отправлено.')
     except (requests.RequestException, apihelper.ApiException) as error:
-        logging.error(f'Ошибка отправки сообщения {error}')
+        logging.error('Ошибка отправки сообщения %s', error)
 
 
 def get_api_answer(timestamp):
     """Запрос к API."""
     params = {'from_date': timestamp}
     logging.debug(
-        f'Отправляю запрос к API - {ENDPOINT}. Параметры запроса: {params}.')
+        'Отправляю запрос к API - %s. Параметры запроса: %s.',
+        ENDPOINT, params
+    )
 
     try:
         response = requests.get(
-            ENDPOINT, headers=HEADERS, params=params
+            ENDPOINT, headers=HEADERS, params=params, timeout=REQUEST_TIMEOUT
         )
         logging.debug('Запрос успешно отправлен.')
     except requests.RequestException as error:
@@ -86,10 +100,10 @@ def check_response(response):
     if not isinstance(response, dict):
         raise TypeError(f'API передал не словарь. Передан {type(response)}.')
 
-    if 'homeworks' not in response:
-        raise KeyError('Отсутствует ключ homeworks.')
-
-    homeworks = response.get('homeworks')
+    try:
+        homeworks = response['homeworks']
+    except KeyError:
+        raise KeyError('Отсутствует ключ homeworks.') from None
 
     if not isinstance(homeworks, list):
         raise TypeError(
@@ -104,23 +118,30 @@ def parse_status(homework):
     """Получение статуса домашней работы."""
     logging.debug('Начало проверки статуса работы.')
 
-    if 'homework_name' not in homework:
-        raise KeyError('Отсутствует ключ homework_name.')
-
-    if 'status' not in homework:
-        raise KeyError('Отсутствует ключ status.')
+    try:
+        homework_name = homework['homework_name']
+    except KeyError:
+        raise KeyError('Отсутствует ключ homework_name.') from None
 
-    homework_name = homework.get('homework_name')
-    homework_status = homework.get('status')
+    try:
+        homework_status = homework['status']
+    except KeyError:
+        raise KeyError('Отсутствует ключ status.') from None
 
-    if homework_status not in HOMEWORK_VERDICTS:
+    try:
+        message = HOMEWORK_MESSAGES[homework_status]
+    except KeyError:
         raise UnknownHomeworkStatusError(
             f'Неизвестный статус домашней работы - {homework_status}.'
-        )
+        ) from None
 
     logging.debug('Проверка статуса работы прошла успешно.')
-    verdict = HOMEWORK_VERDICTS[homework_status]
-    return f'Изменился статус проверки работы "{homework_name}". {verdict}'
+    return message % (homework_name,)
+
+
+def handle_sigterm(signum, frame):
+    """Остановка бота по сигналу SIGTERM."""
+    raise SystemExit(0)
 
 
 def main():
@@ -129,6 +150,7 @@ def main():
     bot = TeleBot(token=TELEGRAM_TOKEN)
     timestamp = int(time.time())
     last_message_error = ''
+    request_failures = 0
 
     while True:
         try:
@@ -145,17 +167,28 @@ def main():
             timestamp = response.get(
                 'current_date', int(time.time())
             )
+            request_failures = 0
 
         except Exception as error:
             current_message_error = f'Сбой в работе программы: {error}.'
-            logging.error(current_message_error, exc_info=True)
 
             if last_message_error != current_message_error:
-                send_message(TELEGRAM_CHAT_ID, current_message_error)
+                logging.error(current_message_error, exc_info=True)
+                send_message(bot, current_message_error)
                 last_message_error = current_message_error
+            else:
+                logging.error(current_message_error)
+
+            if isinstance(error, RequestError):
+                request_failures += 1
+            else:
+                request_failures = 0
 
-        finally:
-            time.sleep(RETRY_PERIOD)
+        retry_period = min(
+            RETRY_PERIOD * 2 ** max(request_failures - 1, 0),
+            MAX_RETRY_PERIOD
+        )
+        time.sleep(retry_period)
 
 
 if __name__ == '__main__':
@@ -163,11 +196,23 @@ if __name__ == '__main__':
         'program.log', encoding='utf_8', mode='w'
     )
     handler_stream = logging.StreamHandler(sys.stdout)
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue, handler_file, handler_stream
+    )
     logging.basicConfig(
         level=logging.DEBUG,
         format=(
             '%(asctime)s [%(levelname)s] %(message)s %(funcName)s - %(lineno)d'
         ),
-        handlers=[handler_file, handler_stream]
+        handlers=[logging.handlers.QueueHandler(log_queue)]
     )
-    main()
+    signal.signal(signal.SIGTERM, handle_sigterm)
+    listener.start()
+    try:
+        main()
+    except SystemExit:
+        logging.info('Получен сигнал SIGTERM, бот остановлен.')
+        raise
+    finally:
+        listener.stop()
@@ -36,6 +36,15 @@ def get_mock_telegram_bot(monkeypatch, random_message):
     return telebot.TeleBot(token='')
 
 
+class RecordingTelegramBot(check_utils.MockTelegramBot):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.messages = []
+
+    def send_message(self, chat_id=None, text=None, **kwargs):
+        self.messages.append(text)
+
+
 class TestHomework:
     HOMEWORK_VERDICTS = {
         'approved': 'Работа проверена: ревьюеру всё понравилось. Ура!',
@@ -822,6 +831,113 @@ class TestHomework:
                     'возникновении ошибки отправки сообщения в Телеграм.'
                 ) from e
 
+    def run_main_cycles(self, monkeypatch, homework_module, api_answers):
+        """
+        Run main() for one loop cycle per item of api_answers.
+
+        Each item is either a response returned by get_api_answer() or an
+        exception raised by it. Return the bot used by main() and the list
+        of periods passed to time.sleep().
+        """
+        monkeypatch.setattr(homework_module, 'PRACTICUM_TOKEN', 'sometoken')
+        monkeypatch.setattr(homework_module, 'TELEGRAM_TOKEN', '1234:abcdefg')
+        monkeypatch.setattr(homework_module, 'TELEGRAM_CHAT_ID', '12345')
+
+        bot = RecordingTelegramBot()
+        answers = iter(api_answers)
+        sleeps = []
+
+        def mock_get_api_answer(timestamp):
+            answer = next(answers)
+            if isinstance(answer, Exception):
+                raise answer
+            return answer
+
+        def mock_sleep(secs):
+            sleeps.append(secs)
+            if len(sleeps) == len(api_answers):
+                raise check_utils.BreakInfiniteLoop('break')
+
+        monkeypatch.setattr(
+            homework_module, 'get_api_answer', mock_get_api_answer
+        )
+        monkeypatch.setattr(homework_module, 'TeleBot', lambda token: bot)
+        monkeypatch.setattr(time, 'sleep', mock_sleep)
+        with pytest.raises(check_utils.BreakInfiniteLoop):
+            homework_module.main()
+        return bot, sleeps
+
+    def test_main_send_message_with_same_status_reviewed_again(
+            self, monkeypatch, homework_module, data_with_new_hw_status
+    ):
+        homework = data_with_new_hw_status['homeworks'][0]
+        reviewed_again = {
+            'homeworks': [
+                {**homework, 'date_updated': '2021-04-12T09:15:00Z'}
+            ],
+            'current_date': data_with_new_hw_status['current_date'] + 1
+        }
+        bot, _ = self.run_main_cycles(
+            monkeypatch,
+            homework_module,
+            [data_with_new_hw_status, reviewed_again]
+        )
+        assert len(bot.messages) == 2, (
+            'Убедитесь, что бот отправляет сообщение о каждой новой '
+            'проверке работы, даже если статус совпадает с предыдущим.'
+        )
+
+    def test_main_backoff_on_request_errors(
+            self, monkeypatch, homework_module, random_timestamp
+    ):
+        request_error = homework_module.RequestError('Эндпоинт недоступен.')
+        empty_response = {'homeworks': [], 'current_date': random_timestamp}
+        _, sleeps = self.run_main_cycles(
+            monkeypatch,
+            homework_module,
+            [request_error] * 5 + [empty_response, request_error]
+        )
+        assert sleeps == [600, 1200, 2400, 3600, 3600, 600, 600], (
+            'Убедитесь, что интервал опроса удваивается начиная со второго '
+            'подряд сбоя запроса, не превышает часа и сбрасывается после '
+            'успешного запроса.'
+        )
+
+    def test_main_no_backoff_on_data_errors(
+            self, monkeypatch, homework_module, random_timestamp
+    ):
+        invalid_response = {
+            'homeworks': [{'homework_name': 'hw123', 'status': 'unknown'}],
+            'current_date': random_timestamp
+        }
+        _, sleeps = self.run_main_cycles(
+            monkeypatch,
+            homework_module,
+            [invalid_response, {}, invalid_response]
+        )
+        assert sleeps == [600, 600, 600], (
+            'Убедитесь, что ошибки в данных ответа API не увеличивают '
+            'интервал опроса.'
+        )
+
+    def test_main_send_error_message_once(
+            self, monkeypatch, homework_module
+    ):
+        error_text = 'Эндпоинт недоступен.'
+        request_error = homework_module.RequestError(error_text)
+        bot, _ = self.run_main_cycles(
+            monkeypatch,
+            homework_module,
+            [request_error, request_error]
+        )
+        assert len(bot.messages) == 1, (
+            'Убедитесь, что бот отправляет сообщение об ошибке в Telegram '
+            'один раз, а повторную такую же ошибку не отправляет.'
+        )
+        assert error_text in bot.messages[0], (
+            'Убедитесь, что сообщение об ошибке содержит текст ошибки.'
+        )
+
     def test_docstrings(self, homework_module):
         for func in self.HOMEWORK_FUNC_WITH_PARAMS_QTY:
             check_utils.check_docstring(homework_module, func)